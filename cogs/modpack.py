@@ -3,14 +3,18 @@ Modpack management for CalmBot.
 Handles modpack category creation, migration, and connection info.
 """
 
+import asyncio
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from cogs.utils import (
     get_logger,
-    load_json,
-    save_json,
+    load_roles_board,
+    dump_roles_board,
+    schedule_save_json,
+    RoleEntry,
     check_permissions,
     admin_only,
     find_category_by_name,
@@ -23,6 +27,12 @@ from cogs.utils import (
 
 log = get_logger("modpack")
 
+# Number of deletion results sent per progress followup
+DELETE_PROGRESS_BATCH = 10
+
+# Maximum channel deletes in flight at once; discord.py still applies rate limits
+CHANNEL_DELETE_CONCURRENCY = 5
+
 
 class ConfirmDeleteView(discord.ui.View):
     """Confirmation view for modpack deletion."""
@@ -49,12 +59,16 @@ class Modpack(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.roles_board = load_json(ROLES_BOARD_FILE, {"channel_id": None, "message_id": None, "roles": []})
+        self.roles_board: dict = {"channel_id": None, "message_id": None, "roles": {}}
         log.info("Modpack cog initialized")
     
-    def _reload_roles_board(self):
+    async def cog_load(self):
+        """Load the roles board off the event loop."""
+        await self._reload_roles_board()
+    
+    async def _reload_roles_board(self):
         """Reload roles board data from disk."""
-        self.roles_board = load_json(ROLES_BOARD_FILE, {"channel_id": None, "message_id": None, "roles": []})
+        self.roles_board = await asyncio.to_thread(load_roles_board)
     
     @app_commands.command(name="setup_modpack", description="Create a modpack category with channels and role")
     @app_commands.describe(
@@ -75,7 +89,7 @@ class Modpack(commands.Cog):
         role_emoji: str = None
     ):
         """Create a new modpack with category, channels, and optional role."""
-        self._reload_roles_board()
+        await self._reload_roles_board()
         guild = interaction.guild
         
         if not guild:
@@ -105,18 +119,23 @@ class Modpack(commands.Cog):
         try:
             # Create category and channels
             category = await guild.create_category(category_name)
-            await guild.create_text_channel("general", category=category)
-            await guild.create_text_channel("technical-help", category=category)
             
-            # Create connection-info with restricted permissions
+            # connection-info gets restricted permissions
             overwrites = {
                 guild.default_role: discord.PermissionOverwrite(send_messages=False, add_reactions=True),
                 guild.me: discord.PermissionOverwrite(send_messages=True)
             }
-            connection_info = await guild.create_text_channel(
-                "connection-info",
-                overwrites=overwrites,
-                category=category
+            
+            # Create the channels together; explicit positions keep their order
+            _, _, connection_info = await asyncio.gather(
+                guild.create_text_channel("general", category=category, position=0),
+                guild.create_text_channel("technical-help", category=category, position=1),
+                guild.create_text_channel(
+                    "connection-info",
+                    overwrites=overwrites,
+                    category=category,
+                    position=2
+                )
             )
             
             # Send connection info message
@@ -152,6 +171,7 @@ class Modpack(commands.Cog):
     
     async def _create_modpack_role(self, guild: discord.Guild, name: str, emoji: str) -> str:
         """Create a modpack notification role and add to roles board."""
+        emoji = emoji.strip()
         try:
             role = await guild.create_role(
                 name=f"{name} Updates",
@@ -171,12 +191,8 @@ class Modpack(commands.Cog):
                 message = await roles_channel.fetch_message(self.roles_board["message_id"])
                 await message.add_reaction(emoji)
                 
-                self.roles_board["roles"].append({
-                    "name": f"{name} Updates",
-                    "emoji": emoji,
-                    "role_id": role.id
-                })
-                save_json(ROLES_BOARD_FILE, self.roles_board)
+                self.roles_board["roles"][str(role.id)] = RoleEntry(role.id, emoji, f"{name} Updates")
+                schedule_save_json(ROLES_BOARD_FILE, dump_roles_board(self.roles_board))
                 
                 # Update roles board message
                 roles_cog = self.bot.get_cog("RolesBoard")
@@ -224,10 +240,8 @@ class Modpack(commands.Cog):
         # Find associated role
         role = None
         role_name = None
-        if "[" in actual_name and "]" in actual_name:
-            modpack_name = actual_name.split("[")[0].strip()
-        else:
-            modpack_name = actual_name
+        head, bracket, _ = actual_name.partition("[")
+        modpack_name = head.strip() if bracket and "]" in actual_name else actual_name
             
         role_name = f"{modpack_name} Updates"
         role = discord.utils.get(guild.roles, name=role_name)
@@ -257,32 +271,37 @@ class Modpack(commands.Cog):
             view=None
         )
         
-        # Delete channels and category
+        # Delete channels and category, streaming progress as we go
         results = []
-        for channel in category.channels:
-            try:
-                await channel.delete(reason=f"Modpack deletion by {interaction.user}")
-                results.append(f"✅ Deleted #{channel.name}")
-            except Exception as e:
-                results.append(f"❌ Failed #{channel.name}: {e}")
+        pending = []
+        
+        async def record(line: str):
+            results.append(line)
+            pending.append(line)
+            if len(pending) >= DELETE_PROGRESS_BATCH:
+                await self._send_progress(interaction, pending)
+        
+        # Channel deletes are independent; run them together and report as each lands
+        reason = f"Modpack deletion by {interaction.user}"
+        semaphore = asyncio.Semaphore(CHANNEL_DELETE_CONCURRENCY)
+        deletions = [self._delete_channel(channel, reason, semaphore) for channel in category.channels]
+        for finished in asyncio.as_completed(deletions):
+            await record(await finished)
         
         try:
             await category.delete(reason=f"Modpack deletion by {interaction.user}")
-            results.append(f"✅ Deleted category **{actual_name}**")
+            await record(f"✅ Deleted category **{actual_name}**")
         except Exception as e:
-            results.append(f"❌ Failed category: {e}")
+            await record(f"❌ Failed category: {e}")
         
         # Delete role and clean up roles board
         if role:
             try:
                 # Remove from roles board
-                self._reload_roles_board()
-                role_data = None
-                for i, rd in enumerate(self.roles_board["roles"]):
-                    if rd["role_id"] == role.id:
-                        role_data = self.roles_board["roles"].pop(i)
-                        save_json(ROLES_BOARD_FILE, self.roles_board)
-                        break
+                await self._reload_roles_board()
+                role_data = self.roles_board["roles"].pop(str(role.id), None)
+                if role_data:
+                    schedule_save_json(ROLES_BOARD_FILE, dump_roles_board(self.roles_board))
                 
                 # Remove reaction if possible
                 if role_data and self.roles_board.get("channel_id") and self.roles_board.get("message_id"):
@@ -290,7 +309,7 @@ class Modpack(commands.Cog):
                         channel = self.bot.get_channel(self.roles_board["channel_id"])
                         if channel:
                             message = await channel.fetch_message(self.roles_board["message_id"])
-                            await message.clear_reaction(role_data["emoji"])
+                            await message.clear_reaction(role_data.emoji)
                     except Exception:
                         pass
                 
@@ -300,22 +319,52 @@ class Modpack(commands.Cog):
                     await roles_cog.update_roles_board()
                 
                 await role.delete(reason=f"Modpack deletion by {interaction.user}")
-                results.append(f"✅ Deleted role **{role.name}**")
+                await record(f"✅ Deleted role **{role.name}**")
             except Exception as e:
-                results.append(f"❌ Failed role: {e}")
+                await record(f"❌ Failed role: {e}")
         
-        success = all("✅" in r for r in results)
+        failed = [r for r in results if not r.startswith("✅")]
+        success = not failed
         embed = success_embed if success else warning_embed
         
+        # Earlier lines were already streamed; keep the summary bounded
+        summary = f"Completed {len(results) - len(failed)}/{len(results)} operation(s)."
+        if pending:
+            summary += "\n" + "\n".join(pending)
+        elif failed:
+            summary += "\n" + "\n".join(failed[-DELETE_PROGRESS_BATCH:])
+        
         await interaction.edit_original_response(
             content=None,
             embed=embed(
                 "Deletion Complete" if success else "Deletion Partial",
-                "\n".join(results)
+                summary
             )
         )
         log.info(f"Deleted modpack: {actual_name}")
     
+    @staticmethod
+    async def _delete_channel(
+        channel: discord.abc.GuildChannel,
+        reason: str,
+        semaphore: asyncio.Semaphore
+    ) -> str:
+        """Delete a channel under the semaphore and return its progress line."""
+        async with semaphore:
+            try:
+                await channel.delete(reason=reason)
+                return f"✅ Deleted #{channel.name}"
+            except Exception as e:
+                return f"❌ Failed #{channel.name}: {e}"
+    
+    async def _send_progress(self, interaction: discord.Interaction, lines: list[str]):
+        """Send a batch of progress lines as an ephemeral followup and clear the batch."""
+        try:
+            await interaction.followup.send("\n".join(lines), ephemeral=True)
+        except discord.HTTPException as e:
+            log.warning(f"Failed to send deletion progress: {e}")
+        lines.clear()
+    
     @app_commands.command(name="migrate_modpack", description="Migrate an existing category to the bot's system")
     @app_commands.describe(
         category_name="Name of existing category",
@@ -401,10 +450,10 @@ class Modpack(commands.Cog):
                 role_message = f"\n✅ Created role **{role_name}**"
             
             # Add to roles board
-            self._reload_roles_board()
+            await self._reload_roles_board()
             
             # Check if already in board
-            if any(rd["role_id"] == role.id for rd in self.roles_board["roles"]):
+            if str(role.id) in self.roles_board["roles"]:
                 role_message += f"\n⚠️ Role already on roles board."
             elif self.roles_board.get("channel_id") and self.roles_board.get("message_id"):
                 try:
@@ -413,12 +462,8 @@ class Modpack(commands.Cog):
                         message = await channel.fetch_message(self.roles_board["message_id"])
                         await message.add_reaction(role_emoji)
                         
-                        self.roles_board["roles"].append({
-                            "name": role_name,
-                            "emoji": role_emoji,
-                            "role_id": role.id
-                        })
-                        save_json(ROLES_BOARD_FILE, self.roles_board)
+                        self.roles_board["roles"][str(role.id)] = RoleEntry(role.id, role_emoji.strip(), role_name)
+                        schedule_save_json(ROLES_BOARD_FILE, dump_roles_board(self.roles_board))
                         
                         roles_cog = self.bot.get_cog("RolesBoard")
                         if roles_cog:
@@ -3,6 +3,14 @@ Roles board management for CalmBot.
 Handles reaction roles for modpack notifications.
 """
 
+import asyncio
+import hashlib
+import json
+import operator
+import os
+import time
+from typing import Iterable, Optional
+
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -10,7 +18,12 @@ from discord import app_commands
 from cogs.utils import (
     get_logger,
     load_json,
-    save_json,
+    load_roles_board,
+    dump_roles_board,
+    schedule_save_json,
+    get_pending_save,
+    RoleEntry,
+    category_base_key,
     check_permissions,
     admin_only,
     success_embed,
@@ -23,70 +36,110 @@ from cogs.utils import (
 
 log = get_logger("roles_board")
 
+# Delay before a requested board refresh runs, so bursts coalesce
+UPDATE_DEBOUNCE_SECONDS = 0.5
+
+# Maximum reaction role updates in flight at once
+ROLE_UPDATE_CONCURRENCY = 16
+
+# How long fetched members (and failed lookups) are reused, and when to
+# prune expired entries
+MEMBER_CACHE_TTL = 30
+MISSING_MEMBER_TTL = 300
+MEMBER_CACHE_MAX = 256
+
+# Channel permissions the bot needs to host the roles board
+REQUIRED_CHANNEL_PERMS = (
+    ("send_messages", "Send Messages"),
+    ("embed_links", "Embed Links"),
+    ("add_reactions", "Add Reactions"),
+    ("read_message_history", "Read Message History"),
+)
+
+# Discord caps select menus at 25 options
+SYNC_PAGE_SIZE = 25
+
+
+def _emoji_key(emoji: discord.PartialEmoji) -> str:
+    """Return the string form an emoji is stored under (<:name:id> for custom emojis)."""
+    return str(emoji) if emoji.id else emoji.name
+
 
 class SyncRolesView(discord.ui.View):
     """View for selecting invalid roles to remove."""
     
-    def __init__(self, bot: commands.Bot, roles_board: dict, invalid_roles: list):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        roles_board: dict,
+        invalid_roles: list[RoleEntry],
+        errors: dict[int, str]
+    ):
         super().__init__(timeout=180)
         self.bot = bot
         self.roles_board = roles_board
         self.invalid_roles = invalid_roles
-        
+        self.errors = errors
+        self._by_id = {role_data.role_id: role_data for role_data in invalid_roles}
+        self.page = 0
+        self.page_count = max(1, -(-len(invalid_roles) // SYNC_PAGE_SIZE))
+        
+        self.select = discord.ui.Select(placeholder="Select roles to remove", min_values=1, row=0)
+        self.select.callback = self.select_callback
+        self.add_item(self.select)
+        
+        if self.page_count == 1:
+            self.remove_item(self.prev_page)
+            self.remove_item(self.next_page)
+        self._build_page()
+    
+    def _build_page(self):
+        """Fill the select menu with the current page of invalid roles."""
+        start = self.page * SYNC_PAGE_SIZE
         options = []
-        for i, role_data in enumerate(invalid_roles[:25]):
-            label = f"{role_data['name']} ({role_data['emoji']})"[:100]
-            desc = role_data.get("error", f"ID: {role_data['role_id']}")[:100]
-            options.append(discord.SelectOption(label=label, value=str(i), description=desc))
-        
-        if options:
-            self.select = discord.ui.Select(
-                placeholder="Select roles to remove",
-                options=options,
-                min_values=1,
-                max_values=len(options)
-            )
-            self.select.callback = self.select_callback
-            self.add_item(self.select)
+        for role_data in self.invalid_roles[start:start + SYNC_PAGE_SIZE]:
+            label = f"{role_data.name} ({role_data.emoji})"[:100]
+            desc = self.errors.get(role_data.role_id, f"ID: {role_data.role_id}")[:100]
+            options.append(discord.SelectOption(label=label, value=str(role_data.role_id), description=desc))
+        
+        self.select.options = options
+        self.select.max_values = len(options)
+        if self.page_count > 1:
+            self.select.placeholder = f"Select roles to remove (page {self.page + 1}/{self.page_count})"
+        self.prev_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
     
     async def select_callback(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         
-        indices = [int(v) for v in self.select.values]
-        roles_to_remove = [self.invalid_roles[i] for i in indices]
+        roles_to_remove = [self._by_id[int(v)] for v in self.select.values]
         
-        # Remove from roles list
-        new_roles = []
-        for role_data in self.roles_board["roles"]:
-            should_keep = True
-            for to_remove in roles_to_remove:
-                if role_data["role_id"] == to_remove["role_id"]:
-                    should_keep = False
-                    break
-            if should_keep:
-                new_roles.append(role_data)
+        # Work on the cog's live copy so its cached lookups stay in sync
+        roles_cog = self.bot.get_cog("RolesBoard")
+        if roles_cog:
+            await roles_cog._reload()
+            self.roles_board = roles_cog.roles_board
         
-        self.roles_board["roles"] = new_roles
-        save_json(ROLES_BOARD_FILE, self.roles_board)
+        # Remove from roles board
+        for role_data in roles_to_remove:
+            self.roles_board["roles"].pop(str(role_data.role_id), None)
         
-        # Remove reactions from message
-        if self.roles_board.get("channel_id") and self.roles_board.get("message_id"):
-            try:
-                channel = self.bot.get_channel(self.roles_board["channel_id"])
-                if channel:
-                    message = await channel.fetch_message(self.roles_board["message_id"])
-                    for role_data in roles_to_remove:
-                        try:
-                            await message.clear_reaction(role_data["emoji"])
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-        
-        # Update board message
-        roles_cog = self.bot.get_cog("RolesBoard")
-        if roles_cog and hasattr(roles_cog, 'update_roles_board'):
-            await roles_cog.update_roles_board()
+        if roles_cog:
+            await roles_cog._save_and_refresh()
+        else:
+            schedule_save_json(ROLES_BOARD_FILE, dump_roles_board(self.roles_board))
+        
+        # Update board message; the refresh clears the removed reactions too
+        if roles_cog:
+            await roles_cog.update_roles_board(clear_emojis=[rd.emoji for rd in roles_to_remove])
+        elif self.roles_board.get("channel_id") and self.roles_board.get("message_id"):
+            channel = self.bot.get_channel(self.roles_board["channel_id"])
+            if channel:
+                message = channel.get_partial_message(self.roles_board["message_id"])
+                await asyncio.gather(
+                    *(message.clear_reaction(rd.emoji) for rd in roles_to_remove),
+                    return_exceptions=True
+                )
         
         await interaction.followup.send(
             embed=success_embed("Cleaned Up", f"Removed {len(roles_to_remove)} invalid role(s)."),
@@ -94,7 +147,19 @@ class SyncRolesView(discord.ui.View):
         )
         self.stop()
     
-    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary, row=1)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(0, self.page - 1)
+        self._build_page()
+        await interaction.response.edit_message(view=self)
+    
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary, row=1)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.page_count - 1, self.page + 1)
+        self._build_page()
+        await interaction.response.edit_message(view=self)
+    
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, row=1)
     async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.send_message("Sync cancelled.", ephemeral=True)
         self.stop()
@@ -105,57 +170,267 @@ class RolesBoard(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.reaction_roles = load_json(REACTION_ROLES_FILE, {})
-        self.roles_board = load_json(ROLES_BOARD_FILE, {"channel_id": None, "message_id": None, "roles": []})
+        # Legacy reaction roles keyed by int message ID for cheap comparisons
+        self.reaction_roles: dict[int, dict] = {}
+        self.roles_board: dict = {"channel_id": None, "message_id": None, "roles": {}}
+        self._board_mtime: Optional[int] = None
+        self._legacy_mtime: Optional[int] = None
+        self._board_digest: Optional[bytes] = None
+        # Last queued board save this cog has already seen (its own or loaded)
+        self._seen_pending_board: Optional[dict] = None
+        self._board_msg_id: Optional[int] = None
+        # Board and legacy message IDs; reactions elsewhere are ignored at once
+        self._tracked_message_ids: frozenset[int] = frozenset()
+        self._emoji_to_role: dict[str, int] = {}
+        self._sorted_roles: list[RoleEntry] = []
+        # Emojis the bot has reacted with on the board message (None = unknown)
+        self._board_reactions: Optional[set[str]] = None
+        self._update_task: Optional[asyncio.Task] = None
+        # (message_id, rendered roles) of the last successful board edit
+        self._last_embed_fp: Optional[tuple] = None
+        self._update_generation = 0
+        # Reactions to clear with the next board refresh
+        self._pending_clears: set[str] = set()
+        # Bounds concurrent role updates so reaction bursts can't pile up
+        self._role_semaphore = asyncio.Semaphore(ROLE_UPDATE_CONCURRENCY)
+        # (expiry, member or None) for REST lookups, keyed by (guild_id, user_id)
+        self._member_cache: dict[tuple[int, int], tuple[float, Optional[discord.Member]]] = {}
+        # Cached once the bot user is known so reaction events skip the lookup
+        self._bot_user_id: Optional[int] = None
         log.info("RolesBoard cog initialized")
     
-    def _reload(self):
-        """Reload data from disk."""
-        self.roles_board = load_json(ROLES_BOARD_FILE, {"channel_id": None, "message_id": None, "roles": []})
+    async def cog_load(self):
+        """Load board data off the event loop before listeners are registered."""
+        await self._reload(force=True)
+        if self.bot.user:
+            self._bot_user_id = self.bot.user.id
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Cache the bot user ID once the connection is ready."""
+        self._bot_user_id = self.bot.user.id
+    
+    async def cog_unload(self):
+        """Cancel any pending board refresh."""
+        if self._update_task and not self._update_task.done():
+            self._update_task.cancel()
+    
+    @staticmethod
+    def _file_mtime(filename: str) -> Optional[int]:
+        """Get a data file's modification time, or None if missing."""
+        try:
+            return os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
+    
+    async def _reload(self, force: bool = False):
+        """Reload data from disk if the files changed since they were last read."""
+        legacy_mtime = self._file_mtime(REACTION_ROLES_FILE)
+        if force or legacy_mtime != self._legacy_mtime:
+            legacy = await asyncio.to_thread(load_json, REACTION_ROLES_FILE, {})
+            self.reaction_roles = {int(message_id): emojis for message_id, emojis in legacy.items()}
+            self._legacy_mtime = legacy_mtime
+            self._refresh_tracked_ids()
+        
+        # Another cog's queued save is newer than the file even if its mtime is unchanged
+        mtime = self._file_mtime(ROLES_BOARD_FILE)
+        pending = get_pending_save(ROLES_BOARD_FILE)
+        if (
+            not force
+            and mtime == self._board_mtime
+            and (pending is None or pending is self._seen_pending_board)
+        ):
+            return
+        
+        self.roles_board = await asyncio.to_thread(load_roles_board)
+        self._board_mtime = mtime
+        self._seen_pending_board = pending
+        self._board_digest = self._compute_digest(dump_roles_board(self.roles_board))
+        self._refresh_indexes()
+    
+    @staticmethod
+    def _compute_digest(data: dict) -> bytes:
+        """Hash serialized roles board contents to detect no-op saves."""
+        blob = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(blob.encode("utf-8"), digest_size=8).digest()
+    
+    async def _save_and_refresh(self):
+        """Save the roles board if it changed and refresh the cached lookups."""
+        # Snapshot on the event loop so the writer thread never sees a mutating dict
+        data = dump_roles_board(self.roles_board)
+        digest = self._compute_digest(data)
+        if digest != self._board_digest:
+            # Coalesced with other saves in the next few hundred ms; once it
+            # lands, the mtime check reloads the (identical) data once
+            schedule_save_json(ROLES_BOARD_FILE, data)
+            self._seen_pending_board = data
+            self._board_digest = digest
+        self._refresh_indexes()
     
-    async def update_roles_board(self) -> bool:
+    def _refresh_tracked_ids(self):
+        """Rebuild the set of message IDs the reaction listeners care about."""
+        tracked = set(self.reaction_roles)
+        if self._board_msg_id:
+            tracked.add(self._board_msg_id)
+        self._tracked_message_ids = frozenset(tracked)
+    
+    def _refresh_indexes(self):
+        """Rebuild lookups derived from the roles board."""
+        message_id = self.roles_board.get("message_id")
+        message_id = int(message_id) if message_id else None
+        if message_id != self._board_msg_id:
+            self._board_reactions = None
+        self._board_msg_id = message_id
+        self._refresh_tracked_ids()
+        
+        # Emojis are stripped when stored, so they match _emoji_key() directly
+        self._emoji_to_role = {
+            role_data.emoji: role_data.role_id
+            for role_data in self.roles_board["roles"].values()
+        }
+        
+        self._sorted_roles = sorted(self.roles_board["roles"].values(), key=operator.attrgetter("name"))
+    
+    def _visible_roles(self, guild: discord.Guild) -> tuple[RoleEntry, ...]:
+        """Get the board roles that still exist in the guild, sorted by name."""
+        get_role = guild.get_role
+        return tuple(rd for rd in self._sorted_roles if get_role(rd.role_id))
+    
+    @staticmethod
+    def _build_board_embed(title: str, description: str, roles: tuple[RoleEntry, ...]) -> discord.Embed:
+        """Build the roles board embed listing the given roles."""
+        fields = [
+            {
+                "name": f"{rd.emoji} {rd.name}",
+                "value": f"React with {rd.emoji} for <@&{rd.role_id}>",
+                "inline": False
+            }
+            for rd in roles
+        ]
+        
+        return discord.Embed.from_dict({
+            "title": title,
+            "description": description,
+            "color": discord.Color.blue().value,
+            "fields": fields,
+            "footer": {"text": "React to get roles • Managed by CalmBot"}
+        })
+    
+    async def update_roles_board(self, clear_emojis: Iterable[str] = ()):
+        """
+        Schedule a refresh of the roles board message.
+        
+        Calls made in quick succession are coalesced into a single edit.
+        
+        Args:
+            clear_emojis: Reactions to clear from the board during the refresh
+        """
+        self._pending_clears.update(clear_emojis)
+        self._update_generation += 1
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.create_task(self._run_debounced_update())
+    
+    async def _run_debounced_update(self):
+        """Wait out the debounce window, then refresh until no new requests arrive."""
+        while True:
+            await asyncio.sleep(UPDATE_DEBOUNCE_SECONDS)
+            generation = self._update_generation
+            try:
+                await self._update_roles_board_now()
+            except Exception as e:
+                log.error(f"Failed to update roles board: {e}")
+            
+            # A request that arrived mid-update may have missed the new state
+            if generation == self._update_generation:
+                return
+    
+    def _get_board_channel(self) -> Optional[discord.TextChannel]:
+        """Get the roles board channel from the bot's current cache."""
+        # Resolved each time: a reconnect replaces the cached guild and channel
+        # objects, and a stale channel would keep pointing at the old guild
+        channel_id = self.roles_board.get("channel_id")
+        return self.bot.get_channel(channel_id) if channel_id else None
+    
+    @staticmethod
+    async def _safe_add_reaction(message: discord.PartialMessage, emoji: str) -> Optional[str]:
+        """
+        Add a reaction without raising, so reactions can be added concurrently.
+        
+        Returns:
+            None on success, otherwise a description of the error
+        """
+        try:
+            await message.add_reaction(emoji)
+        except Exception as e:
+            return str(e)
+        return None
+    
+    async def _update_roles_board_now(self) -> bool:
         """Update the roles board message with current roles."""
-        self._reload()
+        # Cheap mtime check: picks up roles written by the Modpack cog
+        await self._reload()
+        clears, self._pending_clears = self._pending_clears, set()
         
         if not self.roles_board.get("channel_id") or not self.roles_board.get("message_id"):
             return False
         
-        channel = self.bot.get_channel(self.roles_board["channel_id"])
+        channel = self._get_board_channel()
         if not channel:
             return False
         
-        try:
-            message = await channel.fetch_message(self.roles_board["message_id"])
-        except Exception:
-            return False
-        
-        # Build embed
-        embed = discord.Embed(
-            title="📋 Available Server Roles",
-            description="React to get roles for modpack updates and notifications!",
-            color=discord.Color.blue()
-        )
-        
-        sorted_roles = sorted(self.roles_board["roles"], key=lambda x: x["name"])
-        for role_data in sorted_roles:
-            role = channel.guild.get_role(role_data["role_id"])
-            if role:
-                embed.add_field(
-                    name=f"{role_data['emoji']} {role_data['name']}",
-                    value=f"React with {role_data['emoji']} for {role.mention}",
-                    inline=False
-                )
-        
-        embed.set_footer(text="React to get roles • Managed by CalmBot")
-        
-        await message.edit(content="", embed=embed)
-        
-        # Ensure all reactions are present
-        for role_data in self.roles_board["roles"]:
+        # Fetch once to learn which reactions are already placed; afterwards
+        # a PartialMessage is enough to edit and react without a GET
+        if self._board_reactions is None:
             try:
-                await message.add_reaction(role_data["emoji"])
+                fetched = await channel.fetch_message(self.roles_board["message_id"])
             except Exception:
-                pass
+                return False
+            self._board_reactions = {str(r.emoji) for r in fetched.reactions if r.me}
+        
+        message = channel.get_partial_message(self.roles_board["message_id"])
+        
+        # Skip the edit entirely when the rendered roles haven't changed
+        roles = self._visible_roles(channel.guild)
+        fingerprint = (message.id, roles)
+        if fingerprint != self._last_embed_fp:
+            embed = self._build_board_embed(
+                "📋 Available Server Roles",
+                "React to get roles for modpack updates and notifications!",
+                roles
+            )
+            try:
+                await message.edit(content="", embed=embed)
+            except discord.NotFound:
+                self._board_reactions = None
+                self._last_embed_fp = None
+                return False
+            self._last_embed_fp = fingerprint
+        
+        # Forget reactions for removed roles, then clear stale ones and add
+        # only the missing ones on the same message in one batch
+        board_emojis = {rd.emoji for rd in self.roles_board["roles"].values()}
+        self._board_reactions &= board_emojis
+        clears -= board_emojis
+        
+        # With no roles left on the board, one call clears every stale reaction;
+        # otherwise it would also strip members' reactions from surviving roles
+        if len(clears) > 1 and not board_emojis:
+            try:
+                await message.clear_reactions()
+                clears = set()
+                self._board_reactions.clear()
+            except discord.HTTPException as e:
+                log.warning(f"Bulk reaction clear failed, clearing individually: {e}")
+        missing = [emoji for emoji in board_emojis if emoji not in self._board_reactions]
+        results = await asyncio.gather(
+            *(message.clear_reaction(emoji) for emoji in clears),
+            *(self._safe_add_reaction(message, emoji) for emoji in missing),
+            return_exceptions=True
+        )
+        self._board_reactions.update(
+            emoji for emoji, error in zip(missing, results[len(clears):])
+            if error is None
+        )
         
         return True
     
@@ -163,7 +438,7 @@ class RolesBoard(commands.Cog):
     @admin_only()
     async def sync_roles_board(self, interaction: discord.Interaction):
         """Scan for missing or deleted roles and offer cleanup."""
-        self._reload()
+        await self._reload()
         guild = interaction.guild
         
         if not guild:
@@ -194,30 +469,35 @@ class RolesBoard(commands.Cog):
         invalid_roles = []
         valid_count = 0
         
-        for role_data in self.roles_board["roles"]:
-            role = guild.get_role(role_data["role_id"])
+        # Index category names once instead of rescanning per role
+        cat_names = {cat.name for cat in guild.categories}
+        cat_bases_lower = {category_base_key(name) for name in cat_names}
+        cat_bases_lower.discard(None)
+        
+        get_role = guild.get_role
+        errors = {}
+        for role_data in self.roles_board["roles"].values():
+            role = get_role(role_data.role_id)
             if not role:
-                role_data["error"] = "Role deleted from server"
+                errors[role_data.role_id] = "Role deleted from server"
                 invalid_roles.append(role_data)
                 continue
             
             # Check for orphaned roles (no matching modpack category)
+            # Fold once and reuse it for both the suffix check and the lookup
             role_name = role.name
-            modpack_name = role_name[:-8].strip() if role_name.lower().endswith(" updates") else role_name
+            folded = role_name.casefold()
+            if folded.endswith(" updates"):
+                modpack_name = role_name[:-8].strip()
+                modpack_key = folded.removesuffix(" updates").strip()
+            else:
+                modpack_name = role_name
+                modpack_key = folded
             
-            found_category = False
-            for cat in guild.categories:
-                if cat.name == modpack_name:
-                    found_category = True
-                    break
-                if "[" in cat.name and "]" in cat.name:
-                    base = cat.name.split("[")[0].strip()
-                    if base.lower() == modpack_name.lower():
-                        found_category = True
-                        break
+            found_category = modpack_name in cat_names or modpack_key in cat_bases_lower
             
             if not found_category:
-                role_data["error"] = f"No category '{modpack_name}'"
+                errors[role_data.role_id] = f"No category '{modpack_name}'"
                 invalid_roles.append(role_data)
                 continue
             
@@ -240,7 +520,7 @@ class RolesBoard(commands.Cog):
         report += "\n**Select roles to remove:**"
         await interaction.response.send_message(
             report,
-            view=SyncRolesView(self.bot, self.roles_board, invalid_roles),
+            view=SyncRolesView(self.bot, self.roles_board, invalid_roles, errors),
             ephemeral=True
         )
     
@@ -259,6 +539,7 @@ class RolesBoard(commands.Cog):
         description: str = "React to get roles for modpack updates and notifications"
     ):
         """Create a new roles board or update the existing one."""
+        await self._reload()
         guild = interaction.guild
         
         if not guild:
@@ -269,7 +550,7 @@ class RolesBoard(commands.Cog):
             return
         
         # Check permissions
-        bot_member = guild.get_member(self.bot.user.id)
+        bot_member = guild.me
         if not bot_member:
             await interaction.response.send_message(
                 embed=error_embed("Error", "Cannot find bot member."),
@@ -278,15 +559,7 @@ class RolesBoard(commands.Cog):
             return
         
         perms = channel.permissions_for(bot_member)
-        missing = []
-        if not perms.send_messages:
-            missing.append("Send Messages")
-        if not perms.embed_links:
-            missing.append("Embed Links")
-        if not perms.add_reactions:
-            missing.append("Add Reactions")
-        if not perms.read_message_history:
-            missing.append("Read Message History")
+        missing = [label for attr, label in REQUIRED_CHANNEL_PERMS if not getattr(perms, attr)]
         if not bot_member.guild_permissions.manage_roles:
             missing.append("Manage Roles")
         
@@ -303,46 +576,28 @@ class RolesBoard(commands.Cog):
         # Delete old message if exists
         if self.roles_board.get("channel_id") and self.roles_board.get("message_id"):
             try:
-                old_channel = self.bot.get_channel(self.roles_board["channel_id"])
+                old_channel = self._get_board_channel()
                 if old_channel:
-                    old_msg = await old_channel.fetch_message(self.roles_board["message_id"])
-                    await old_msg.delete()
+                    await old_channel.get_partial_message(self.roles_board["message_id"]).delete()
             except Exception:
                 pass
         
-        # Create new embed
-        embed = discord.Embed(
-            title=f"📋 {title}",
-            description=description,
-            color=discord.Color.blue()
-        )
-        
-        sorted_roles = sorted(self.roles_board.get("roles", []), key=lambda x: x["name"])
-        for role_data in sorted_roles:
-            role = guild.get_role(role_data["role_id"])
-            if role:
-                embed.add_field(
-                    name=f"{role_data['emoji']} {role_data['name']}",
-                    value=f"React with {role_data['emoji']} for {role.mention}",
-                    inline=False
-                )
-        
-        embed.set_footer(text="React to get roles • Managed by CalmBot")
+        embed = self._build_board_embed(f"📋 {title}", description, self._visible_roles(guild))
         
         try:
             message = await channel.send(embed=embed)
             
             self.roles_board["channel_id"] = channel.id
             self.roles_board["message_id"] = message.id
-            save_json(ROLES_BOARD_FILE, self.roles_board)
+            await self._save_and_refresh()
             
             # Add reactions
-            failed = []
-            for role_data in self.roles_board.get("roles", []):
-                try:
-                    await message.add_reaction(role_data["emoji"])
-                except Exception as e:
-                    failed.append(f"{role_data['emoji']}: {e}")
+            roles = list(self.roles_board["roles"].values())
+            errors = await asyncio.gather(
+                *(self._safe_add_reaction(message, rd.emoji) for rd in roles)
+            )
+            failed = [f"{rd.emoji}: {error}" for rd, error in zip(roles, errors) if error]
+            self._board_reactions = {rd.emoji for rd, error in zip(roles, errors) if error is None}
             
             result = f"Roles board created in {channel.mention}!"
             if failed:
@@ -365,132 +620,147 @@ class RolesBoard(commands.Cog):
                 ephemeral=True
             )
     
-    @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
-        """Handle reaction add for role assignment."""
-        if payload.user_id == self.bot.user.id:
-            return
-        
-        self._reload()
-        
-        # Check if it's our roles board
-        if not self.roles_board.get("message_id"):
-            return
-        
-        if str(payload.message_id) != str(self.roles_board["message_id"]):
-            # Check legacy reaction roles
-            await self._handle_legacy_reaction(payload, add=True)
-            return
-        
-        emoji = payload.emoji.name if not payload.emoji.id else str(payload.emoji)
-        role_id = None
-        
-        for role_data in self.roles_board["roles"]:
-            if emoji == role_data["emoji"] or emoji == role_data["emoji"].strip():
-                role_id = role_data["role_id"]
-                break
+    async def _get_member(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """
+        Get a guild member from the cache, falling back to a short-lived fetch cache.
         
-        if not role_id:
-            return
+        Users who aren't in the guild are remembered too, so repeated
+        reactions from them don't keep hitting 404s.
         
-        guild = self.bot.get_guild(payload.guild_id)
-        if not guild:
-            return
-        
-        role = guild.get_role(role_id)
-        if not role:
-            return
-        
-        member = guild.get_member(payload.user_id)
-        if not member:
-            try:
-                member = await guild.fetch_member(payload.user_id)
-            except Exception:
-                return
+        Args:
+            guild: Guild the member belongs to
+            user_id: ID of the member
+            
+        Returns:
+            The member, or None if they could not be fetched
+        """
+        member = guild.get_member(user_id)
+        if member:
+            return member
+        
+        key = (guild.id, user_id)
+        now = time.monotonic()
+        cached = self._member_cache.get(key)
+        if cached:
+            if now < cached[0]:
+                return cached[1]
+            del self._member_cache[key]
         
         try:
-            await member.add_roles(role, reason="Reaction role from roles board")
-            log.debug(f"Added role {role.name} to {member}")
-        except Exception as e:
-            log.error(f"Failed to add role: {e}")
+            member = await guild.fetch_member(user_id)
+            expires = now + MEMBER_CACHE_TTL
+        except (discord.NotFound, discord.Forbidden):
+            member = None
+            expires = now + MISSING_MEMBER_TTL
+        except Exception:
+            return None
+        
+        # Drop expired entries so the cache stays small
+        if len(self._member_cache) >= MEMBER_CACHE_MAX:
+            self._member_cache = {
+                k: v for k, v in self._member_cache.items()
+                if now < v[0]
+            }
+        self._member_cache[key] = (expires, member)
+        return member
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """Handle reaction add for role assignment."""
+        await self._handle_reaction(payload, add=True)
     
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
         """Handle reaction remove for role removal."""
-        if payload.user_id == self.bot.user.id:
+        await self._handle_reaction(payload, add=False)
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear(self, payload: discord.RawReactionClearEvent):
+        """Forget the board's reactions once all of them are removed."""
+        if payload.message_id == self._board_msg_id and self._board_reactions is not None:
+            self._board_reactions.clear()
+    
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear_emoji(self, payload: discord.RawReactionClearEmojiEvent):
+        """Forget a board reaction once every reaction with its emoji is removed."""
+        if payload.message_id == self._board_msg_id and self._board_reactions is not None:
+            self._board_reactions.discard(str(payload.emoji))
+    
+    async def _handle_reaction(self, payload: discord.RawReactionActionEvent, add: bool):
+        """Resolve a reaction to a board or legacy role and apply the role update."""
+        # Bail out before any work unless the message is one we manage
+        if payload.message_id not in self._tracked_message_ids:
             return
         
-        self._reload()
-        
-        if not self.roles_board.get("message_id"):
+        if payload.user_id == self._bot_user_id:
+            # Our own board reaction was removed; the next refresh re-adds it
+            if not add and payload.message_id == self._board_msg_id and self._board_reactions is not None:
+                self._board_reactions.discard(str(payload.emoji))
             return
         
-        if str(payload.message_id) != str(self.roles_board["message_id"]):
-            await self._handle_legacy_reaction(payload, add=False)
+        if payload.message_id != self._board_msg_id:
+            await self._handle_legacy_reaction(payload, add)
             return
         
-        emoji = payload.emoji.name if not payload.emoji.id else str(payload.emoji)
-        role_id = None
-        
-        for role_data in self.roles_board["roles"]:
-            if role_data["emoji"] == emoji:
-                role_id = role_data["role_id"]
-                break
-        
+        role_id = self._emoji_to_role.get(_emoji_key(payload.emoji))
         if not role_id:
             return
         
-        guild = self.bot.get_guild(payload.guild_id)
-        if not guild:
-            return
-        
-        role = guild.get_role(role_id)
-        if not role:
-            return
-        
-        member = guild.get_member(payload.user_id)
-        if not member:
-            try:
-                member = await guild.fetch_member(payload.user_id)
-            except Exception:
-                return
-        
-        try:
-            await member.remove_roles(role, reason="Reaction role removed")
-            log.debug(f"Removed role {role.name} from {member}")
-        except Exception as e:
-            log.error(f"Failed to remove role: {e}")
+        reason = "Reaction role from roles board" if add else "Reaction role removed"
+        await self._apply_role(payload, role_id, add, reason)
     
     async def _handle_legacy_reaction(self, payload: discord.RawReactionActionEvent, add: bool):
         """Handle legacy reaction roles from separate config."""
-        message_id = str(payload.message_id)
-        if message_id not in self.reaction_roles:
-            return
-        
-        emoji = payload.emoji.name if not payload.emoji.id else str(payload.emoji)
-        if emoji not in self.reaction_roles[message_id]:
-            return
-        
-        role_id = self.reaction_roles[message_id][emoji]
-        guild = self.bot.get_guild(payload.guild_id)
-        if not guild:
+        emoji_roles = self.reaction_roles.get(payload.message_id)
+        if not emoji_roles:
             return
         
-        role = guild.get_role(role_id)
-        if not role:
-            return
-        
-        member = guild.get_member(payload.user_id)
-        if not member:
+        role_id = emoji_roles.get(_emoji_key(payload.emoji))
+        if not role_id:
             return
         
-        try:
-            if add:
-                await member.add_roles(role, reason="Reaction role")
-            else:
-                await member.remove_roles(role, reason="Reaction role removed")
-        except Exception:
-            pass
+        reason = "Reaction role" if add else "Reaction role removed"
+        await self._apply_role(payload, role_id, add, reason)
+    
+    async def _apply_role(
+        self,
+        payload: discord.RawReactionActionEvent,
+        role_id: int,
+        add: bool,
+        reason: str
+    ):
+        """
+        Add or remove a reaction role for the reacting member.
+        
+        Args:
+            payload: The raw reaction event
+            role_id: ID of the role to add or remove
+            add: True to add the role, False to remove it
+            reason: Audit log reason
+        """
+        async with self._role_semaphore:
+            guild = self.bot.get_guild(payload.guild_id)
+            if not guild:
+                return
+            
+            role = guild.get_role(role_id)
+            if not role:
+                return
+            
+            # Guild reaction adds carry the member, so the fetch is a last resort
+            member = payload.member or await self._get_member(guild, payload.user_id)
+            if not member:
+                return
+            
+            try:
+                if add:
+                    await member.add_roles(role, reason=reason)
+                    log.debug(f"Added role {role.name} to {member}")
+                else:
+                    await member.remove_roles(role, reason=reason)
+                    log.debug(f"Removed role {role.name} from {member}")
+            except Exception as e:
+                log.error(f"Failed to {'add' if add else 'remove'} role {role.name}: {e}")
 
 
 async def setup(bot: commands.Bot):
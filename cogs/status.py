@@ -3,8 +3,11 @@ Status rotator for CalmBot.
 Randomly cycles through custom status messages.
 """
 
+import asyncio
 import os
 import random
+from collections import deque
+from typing import Optional
 
 import discord
 from discord.ext import commands, tasks
@@ -23,42 +26,80 @@ class StatusRotator(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.statuses: list[str] = []
-        self._load_statuses()
+        # Shuffled statuses still to show this round, and the one showing now
+        self._status_queue: deque[str] = deque()
+        self._current: Optional[str] = None
+        self._statuses_mtime: Optional[int] = None
         self.status_loop.start()
-        log.info(f"Status rotator initialized with {len(self.statuses)} statuses")
     
-    def _load_statuses(self):
-        """Load status messages from file."""
+    @staticmethod
+    def _read_statuses() -> list[str]:
+        """Read status messages from file."""
         if os.path.exists(STATUS_FILE):
             try:
                 with open(STATUS_FILE, "r", encoding="utf-8") as f:
-                    self.statuses = [line.strip() for line in f if line.strip()]
+                    return [line.strip() for line in f if line.strip()]
             except Exception as e:
                 log.error(f"Failed to load statuses: {e}")
-                self.statuses = []
+        return []
+    
+    async def _reload_statuses(self, force: bool = False):
+        """Reload status messages if the file changed since it was last read."""
+        try:
+            mtime = os.stat(STATUS_FILE).st_mtime_ns
+        except OSError:
+            mtime = None
+        if not force and mtime == self._statuses_mtime:
+            return
+        
+        self._statuses_mtime = mtime
+        self.statuses = await asyncio.to_thread(self._read_statuses)
+        self._status_queue.clear()
         
         if not self.statuses:
             self.statuses = ["CalmBot • /help"]
             log.warning("No statuses found, using default")
     
+    def _next_status(self) -> str:
+        """Take the next status from a shuffled round, refilling it when empty."""
+        if not self._status_queue:
+            round_ = self.statuses[:]
+            random.shuffle(round_)
+            self._status_queue.extend(round_)
+        
+        status = self._status_queue.popleft()
+        # A new round can start with the status that ended the last one
+        if status == self._current and self._status_queue:
+            self._status_queue.append(status)
+            status = self._status_queue.popleft()
+        return status
+    
     async def cog_unload(self):
         """Clean up when cog is unloaded."""
         self.status_loop.cancel()
     
     @tasks.loop(seconds=INTERVAL_SECONDS)
     async def status_loop(self):
-        """Rotate to a random status."""
+        """Rotate to the next status in the shuffled round."""
         try:
-            status = random.choice(self.statuses)
+            # Pick up edits to the status file without a reload
+            await self._reload_statuses()
+            status = self._next_status()
+            # Nothing visible would change, so skip the presence update
+            if status == self._current:
+                return
             await self.bot.change_presence(
                 activity=discord.CustomActivity(name=status)
             )
+            self._current = status
         except Exception as e:
             log.error(f"Failed to change status: {e}")
     
     @status_loop.before_loop
     async def before_status_loop(self):
-        """Wait for bot to be ready before starting loop."""
+        """Load statuses, then wait for bot to be ready before starting loop."""
+        await self._reload_statuses(force=True)
+        log.info(f"Status rotator initialized with {len(self.statuses)} statuses")
         await self.bot.wait_until_ready()
 
 
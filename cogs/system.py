@@ -3,7 +3,10 @@ System commands for CalmBot.
 Provides administrative utilities like cog reloading.
 """
 
+import asyncio
 import os
+from itertools import islice
+from typing import Optional
 
 import discord
 from discord.ext import commands
@@ -13,6 +16,35 @@ from cogs.utils import get_logger, admin_only, success_embed, error_embed, info_
 
 log = get_logger("system")
 
+COGS_DIR = "./cogs"
+
+# Maximum cogs reloaded at once by /reload all
+RELOAD_CONCURRENCY = 4
+
+# (directory mtime, sorted cog names, lowercased names) from the last scan
+_cog_names_cache: Optional[tuple[int, list[str], list[str]]] = None
+
+
+def _get_cog_names() -> tuple[list[str], list[str]]:
+    """
+    Get the loadable cog names, rescanning only when the cogs directory changes.
+    
+    Returns:
+        Sorted cog names and their lowercased forms, in the same order
+    """
+    global _cog_names_cache
+    
+    mtime = os.stat(COGS_DIR).st_mtime_ns
+    if _cog_names_cache is None or _cog_names_cache[0] != mtime:
+        with os.scandir(COGS_DIR) as entries:
+            names = sorted(
+                entry.name[:-3] for entry in entries
+                if entry.name.endswith(".py") and entry.name != "utils.py" and entry.is_file()
+            )
+        _cog_names_cache = (mtime, names, [name.lower() for name in names])
+    
+    return _cog_names_cache[1], _cog_names_cache[2]
+
 
 class System(commands.Cog):
     """System administration commands."""
@@ -21,6 +53,22 @@ class System(commands.Cog):
         self.bot = bot
         log.info("System cog initialized")
     
+    async def _reload_one(self, name: str, semaphore: asyncio.Semaphore) -> str:
+        """Reload (or load) one cog and describe the outcome."""
+        cog_name = f"cogs.{name}"
+        async with semaphore:
+            try:
+                await self.bot.reload_extension(cog_name)
+                return f"✅ {name}"
+            except commands.ExtensionNotLoaded:
+                try:
+                    await self.bot.load_extension(cog_name)
+                    return f"🆕 {name}"
+                except Exception as e:
+                    return f"❌ {name}: {e}"
+            except Exception as e:
+                return f"❌ {name}: {e}"
+    
     @app_commands.command(name="reload", description="Reload a cog or all cogs")
     @app_commands.describe(extension="The cog to reload (e.g. 'autosend') or 'all'")
     @admin_only()
@@ -29,23 +77,10 @@ class System(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         
         if extension.lower() == "all":
-            results = []
-            for filename in sorted(os.listdir("./cogs")):
-                if not filename.endswith(".py") or filename == "utils.py":
-                    continue
-                
-                cog_name = f"cogs.{filename[:-3]}"
-                try:
-                    await self.bot.reload_extension(cog_name)
-                    results.append(f"✅ {cog_name.split('.')[-1]}")
-                except commands.ExtensionNotLoaded:
-                    try:
-                        await self.bot.load_extension(cog_name)
-                        results.append(f"🆕 {cog_name.split('.')[-1]}")
-                    except Exception as e:
-                        results.append(f"❌ {cog_name.split('.')[-1]}: {e}")
-                except Exception as e:
-                    results.append(f"❌ {cog_name.split('.')[-1]}: {e}")
+            names, _ = _get_cog_names()
+            semaphore = asyncio.Semaphore(RELOAD_CONCURRENCY)
+            # gather keeps input order, so results stay sorted by cog name
+            results = await asyncio.gather(*(self._reload_one(name, semaphore) for name in names))
             
             success_count = sum(1 for r in results if r.startswith(("✅", "🆕")))
             
@@ -87,16 +122,15 @@ class System(commands.Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Provide autocomplete for extension names."""
-        cogs = ["all"]
-        for filename in os.listdir("./cogs"):
-            if filename.endswith(".py") and filename != "utils.py":
-                cogs.append(filename[:-3])
+        names, lowered = _get_cog_names()
+        current = current.lower()
         
-        return [
-            app_commands.Choice(name=cog, value=cog)
-            for cog in cogs
-            if current.lower() in cog.lower()
-        ][:25]
+        # Stop scanning once Discord's 25-choice limit is reached
+        matches = (
+            cog for cog, cog_lower in zip(["all", *names], ["all", *lowered])
+            if current in cog_lower
+        )
+        return [app_commands.Choice(name=cog, value=cog) for cog in islice(matches, 25)]
 
 
 async def setup(bot: commands.Bot):
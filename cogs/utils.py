@@ -3,18 +3,30 @@ Shared utilities for CalmBot.
 Provides logging, permissions, embed helpers, and common functions.
 """
 
+import asyncio
+import atexit
+import copy
 import json
 import os
 import logging
+import logging.handlers
 import functools
+import queue
+import threading
+import time
 from enum import Enum
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, NamedTuple
 from datetime import datetime
 
 import discord
 from discord import app_commands
 from ampapi import AMPControllerInstance
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -32,21 +44,43 @@ def setup_logging(name: str = "calmbot", level: int = logging.INFO) -> logging.L
     """
     logger = logging.getLogger(name)
     
-    if not logger.handlers:
+    # Child loggers propagate to "calmbot"; a second handler would log twice
+    if not logger.hasHandlers():
         logger.setLevel(level)
         
-        # Console handler with formatting
-        handler = logging.StreamHandler()
+        # Records are queued here and written to the console by a
+        # background thread, so logging never blocks the event loop
+        handler = logging.handlers.QueueHandler(_get_log_queue())
         handler.setLevel(level)
+        logger.addHandler(handler)
+    
+    return logger
+
+
+_log_queue: Optional[queue.SimpleQueue] = None
+
+
+def _get_log_queue() -> queue.SimpleQueue:
+    """Get the shared log queue, starting its console writer on first use."""
+    global _log_queue
+    
+    if _log_queue is None:
+        _log_queue = queue.SimpleQueue()
         
+        # Console handler with formatting
+        console = logging.StreamHandler()
         formatter = logging.Formatter(
             fmt="%(asctime)s │ %(levelname)-8s │ %(name)-20s │ %(message)s",
             datefmt="%H:%M:%S"
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        console.setFormatter(formatter)
+        
+        listener = logging.handlers.QueueListener(_log_queue, console)
+        listener.start()
+        # Flush queued records on interpreter exit
+        atexit.register(listener.stop)
     
-    return logger
+    return _log_queue
 
 
 # Create root logger for the bot
@@ -89,14 +123,23 @@ def load_json(filename: str, default: Any = None) -> Any:
     """
     if default is None:
         default = {}
+    
+    # A queued save is newer than what's on disk; fetch it in one lookup
+    # since this may run in a worker thread while the save lands
+    pending = _pending_saves.get(filename)
+    if pending is not None:
+        return copy.deepcopy(pending)
         
     if not os.path.exists(filename):
         return default
         
     try:
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filename, 'r', encoding='utf-8') as f:
             return json.load(f)
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         _json_log.error(f"Invalid JSON in {filename}: {e}")
         return default
     except OSError as e:
@@ -108,6 +151,9 @@ def save_json(filename: str, data: Any) -> bool:
     """
     Safely save data to a JSON file.
     
+    Writes to a temporary file first and swaps it into place, so a crash
+    mid-write never leaves a truncated file behind.
+    
     Args:
         filename: Path to JSON file
         data: Data to serialize
@@ -115,18 +161,143 @@ def save_json(filename: str, data: Any) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    # This write supersedes any queued one
+    _pending_saves.pop(filename, None)
+    return _write_json(filename, data)
+
+
+def _write_json(filename: str, data: Any) -> bool:
+    """Serialize data and atomically replace filename with it."""
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Per-thread temp name so concurrent writers never share a file
+        tmp_filename = f"{filename}.{threading.get_ident()}.tmp"
+        # Encode up front so the file is written with a single write() call
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2).encode('utf-8')
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_filename, filename)
         return True
     except OSError as e:
         _json_log.error(f"Cannot write {filename}: {e}")
         return False
 
 
+# Delay before a scheduled save is written, so bursts of changes coalesce
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Latest unwritten data per file, and the task that will write it
+_pending_saves: dict[str, Any] = {}
+_save_tasks: dict[str, asyncio.Task] = {}
+
+
+def schedule_save_json(filename: str, data: Any) -> None:
+    """
+    Queue data to be saved shortly, coalescing repeated saves of one file.
+    
+    The write happens in a worker thread. Until it lands, load_json()
+    returns a copy of the queued data. The caller must not mutate data
+    after queueing it.
+    
+    Args:
+        filename: Path to JSON file
+        data: Data to serialize
+    """
+    _pending_saves[filename] = data
+    task = _save_tasks.get(filename)
+    if task is None or task.done():
+        _save_tasks[filename] = asyncio.create_task(_flush_save(filename))
+
+
+def get_pending_save(filename: str) -> Any:
+    """Get the data queued for a file by schedule_save_json(), or None."""
+    return _pending_saves.get(filename)
+
+
+async def _flush_save(filename: str):
+    """Write the queued data for a file once saves stop arriving."""
+    while filename in _pending_saves:
+        await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+        data = _pending_saves.get(filename)
+        if data is None:
+            return
+        await asyncio.to_thread(_write_json, filename, data)
+        # Keep the entry if a newer save was queued during the write
+        if _pending_saves.get(filename) is data:
+            del _pending_saves[filename]
+
+
+async def flush_pending_saves() -> None:
+    """Wait for all queued saves to be written. Call before shutting down."""
+    # Let the save tasks finish rather than cancelling them: a cancelled task's
+    # worker-thread write keeps running and could land after a newer one
+    tasks = [task for task in _save_tasks.values() if not task.done()]
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    # Anything still queued (e.g. its task failed) is written directly
+    while _pending_saves:
+        filename, data = _pending_saves.popitem()
+        await asyncio.to_thread(_write_json, filename, data)
+
+
+class RoleEntry(NamedTuple):
+    """A reaction role listed on the roles board."""
+    role_id: int
+    emoji: str
+    name: str
+
+
+def load_roles_board() -> dict:
+    """
+    Load the roles board with its roles parsed into RoleEntry records.
+    
+    Roles are keyed by str(role_id) so lookups and removals by role ID
+    don't need to scan the whole board. The legacy list format is
+    migrated on first load.
+    
+    Returns:
+        Roles board data with a {str(role_id): RoleEntry} dict of roles
+    """
+    board = load_json(ROLES_BOARD_FILE, {"channel_id": None, "message_id": None, "roles": {}})
+    roles = board.get("roles")
+    
+    migrated = isinstance(roles, list)
+    if migrated:
+        roles = {str(rd["role_id"]): rd for rd in roles}
+    elif not isinstance(roles, dict):
+        roles = {}
+    
+    board["roles"] = {
+        key: RoleEntry(rd["role_id"], rd["emoji"].strip(), rd["name"])
+        for key, rd in roles.items()
+    }
+    
+    if migrated:
+        save_roles_board(board)
+        _json_log.info(f"Migrated {len(roles)} roles board entries to the keyed format")
+    
+    return board
+
+
+def dump_roles_board(board: dict) -> dict:
+    """Convert a loaded roles board back into its JSON-serializable form."""
+    return {
+        **board,
+        "roles": {key: entry._asdict() for key, entry in board["roles"].items()}
+    }
+
+
+def save_roles_board(board: dict) -> bool:
+    """Save a roles board loaded with load_roles_board()."""
+    return save_json(ROLES_BOARD_FILE, dump_roles_board(board))
+
+
 # =============================================================================
 # EMBED BUILDER - CONSISTENT UX
 # =============================================================================
@@ -221,7 +392,10 @@ def info_embed(title: str, description: str = None, **kwargs) -> discord.Embed:
 _perm_log = get_logger("permissions")
 
 # Configurable mod role names
-MOD_ROLE_NAMES = {"Moderators", "Admins", "Mods", "Staff", "Admin", "Moderator"}
+MOD_ROLE_NAMES = frozenset({"Moderators", "Admins", "Mods", "Staff", "Admin", "Moderator"})
+
+# Role permissions that grant mod access (manage_guild or manage_channels)
+_MOD_PERM_MASK = discord.Permissions(manage_guild=True, manage_channels=True).value
 
 
 def has_mod_permissions(member: discord.Member) -> bool:
@@ -238,18 +412,15 @@ def has_mod_permissions(member: discord.Member) -> bool:
     if member.guild.owner_id == member.id:
         return True
     
-    # Direct admin permission
-    if member.guild_permissions.administrator:
-        return True
-    
-    # Check for mod roles or permissions
-    for role in member.roles:
-        if role.name in MOD_ROLE_NAMES:
-            return True
-        if role.permissions.manage_guild or role.permissions.manage_channels:
-            return True
-    
-    return False
+    roles = member.roles
+    return (
+        # Direct admin permission
+        member.guild_permissions.administrator
+        # Mod role names
+        or not MOD_ROLE_NAMES.isdisjoint(role.name for role in roles)
+        # Mod-level role permissions, both flags tested with one AND
+        or any(role.permissions.value & _MOD_PERM_MASK for role in roles)
+    )
 
 
 async def check_permissions(interaction: discord.Interaction) -> bool:
@@ -302,9 +473,7 @@ async def has_admin_or_mod_permissions(interaction: discord.Interaction) -> bool
 
 def is_valid_url(url: Optional[str]) -> bool:
     """Check if a string is a valid HTTP(S) URL."""
-    if not url or not isinstance(url, str):
-        return False
-    return url.startswith("http://") or url.startswith("https://")
+    return isinstance(url, str) and url.startswith(("http://", "https://"))
 
 
 def safe_embed_color(color_input: Optional[str]) -> int:
@@ -332,6 +501,27 @@ def safe_embed_color(color_input: Optional[str]) -> int:
 # DISCORD HELPERS
 # =============================================================================
 
+# (exact name -> id, base key -> id) per guild, built on first lookup
+_category_index: dict[int, tuple[dict[str, int], dict[str, int]]] = {}
+
+
+@functools.lru_cache(maxsize=512)
+def category_base_key(name: str) -> Optional[str]:
+    """
+    Get the casefolded base name of a "Name [MODLOADER]" category.
+    
+    Args:
+        name: Category name
+        
+    Returns:
+        The casefolded name before the bracket, or None if there is no suffix
+    """
+    head, bracket, _ = name.partition("[")
+    if bracket and "]" in name:
+        return head.strip().casefold()
+    return None
+
+
 async def find_category_by_name(
     guild: discord.Guild, 
     input_name: str
@@ -346,21 +536,48 @@ async def find_category_by_name(
     Returns:
         The category if found, None otherwise
     """
-    # Exact match first
-    category = discord.utils.get(guild.categories, name=input_name)
-    if category:
-        return category
+    input_key = input_name.strip().casefold()
+    index = _category_index.get(guild.id)
+    fresh = index is None
     
-    # Try matching base name (before [MODLOADER])
-    input_lower = input_name.lower().strip()
+    while True:
+        if index is None:
+            index = _build_category_index(guild)
+        
+        # Exact match first, then the base name (before [MODLOADER])
+        exact, bases = index
+        category_id = exact.get(input_name) or bases.get(input_key)
+        category = guild.get_channel(category_id) if category_id else None
+        # Renames missed while disconnected leave stale entries; verify the hit
+        if isinstance(category, discord.CategoryChannel) and (
+            category.name == input_name or category_base_key(category.name) == input_key
+        ):
+            return category
+        
+        # A miss or stale hit on an older index; rebuild once and retry
+        if fresh:
+            return None
+        index = None
+        fresh = True
+
+
+def _build_category_index(guild: discord.Guild) -> tuple[dict[str, int], dict[str, int]]:
+    """Index a guild's categories by exact name and casefolded base name."""
+    exact: dict[str, int] = {}
+    bases: dict[str, int] = {}
     for category in guild.categories:
-        name = category.name
-        if "[" in name and "]" in name:
-            base_name = name.split("[")[0].strip()
-            if base_name.lower() == input_lower:
-                return category
+        exact.setdefault(category.name, category.id)
+        base_key = category_base_key(category.name)
+        if base_key is not None:
+            bases.setdefault(base_key, category.id)
     
-    return None
+    _category_index[guild.id] = (exact, bases)
+    return exact, bases
+
+
+def invalidate_category_index(guild_id: int) -> None:
+    """Drop a guild's category index after its categories change."""
+    _category_index.pop(guild_id, None)
 
 
 # =============================================================================
@@ -370,19 +587,72 @@ async def find_category_by_name(
 _amp_log = get_logger("amp")
 
 
+# Lowercased module names of the ADS/Controller instance, which isn't managed
+_ADS_MODULE_NAMES = frozenset({'application deployment service', 'ads module', 'controller'})
+
+# How long a fetched instance list is reused before asking AMP again
+INSTANCES_CACHE_TTL = 10.0
+
+# Minimum seconds between forced AMP session resets
+SESSION_RESET_INTERVAL = 300.0
+_last_session_reset = float("-inf")
+
+# (fetch time, instances) from the last successful fetch
+_instances_cache: Optional[tuple[float, list]] = None
+# The refresh currently in progress, shared by every caller that needs it
+_instances_inflight: Optional[asyncio.Task] = None
+
+
 async def fetch_valid_instances() -> list:
     """
     Fetch and filter AMP instances, excluding ADS/Controller.
     
+    Results are cached for INSTANCES_CACHE_TTL seconds, and concurrent
+    callers during a refresh all await that single fetch, including when
+    it fails.
+    
     Returns:
         List of valid managed instances
     """
+    global _instances_inflight
+    
+    cached = _instances_cache
+    if cached and time.monotonic() - cached[0] < INSTANCES_CACHE_TTL:
+        return list(cached[1])
+    
+    if _instances_inflight is None or _instances_inflight.done():
+        _instances_inflight = asyncio.create_task(_refresh_instances_cache())
+    
+    # Shielded so one cancelled caller doesn't cancel the fetch for the rest
+    instances = await asyncio.shield(_instances_inflight)
+    return list(instances)
+
+
+async def _refresh_instances_cache() -> list:
+    """Fetch instances and cache a non-empty result."""
+    global _instances_cache
+    
+    instances = await _fetch_instances()
+    if instances:
+        _instances_cache = (time.monotonic(), instances)
+    return instances
+
+
+async def _fetch_instances() -> list:
+    """Fetch and filter AMP instances from the API, bypassing the cache."""
+    global _last_session_reset
+    
     try:
         ads = AMPControllerInstance()
         
-        # Force session clear to prevent server-side caching
-        if hasattr(ads, '_bridge') and hasattr(ads._bridge, '_sessions'):
-            ads._bridge._sessions.clear()
+        # Periodically drop AMP sessions so stale server-side state can't
+        # linger. Not per call: that forced a fresh login on every fetch,
+        # and the instance cache already bounds how stale results can be.
+        now = time.monotonic()
+        if now - _last_session_reset > SESSION_RESET_INTERVAL:
+            if hasattr(ads, '_bridge') and hasattr(ads._bridge, '_sessions'):
+                ads._bridge._sessions.clear()
+            _last_session_reset = now
 
         fetched_instances = await ads.get_instances(format_data=True)
         
@@ -394,10 +664,11 @@ async def fetch_valid_instances() -> list:
         for inst in fetched_instances:
             # Filter out ADS/Controller
             mod_name = str(getattr(inst, 'module_display_name', '')).lower()
-            friendly_name = str(getattr(inst, 'friendly_name', '')).strip().lower()
             
-            if mod_name in ('application deployment service', 'ads module', 'controller'):
+            if mod_name in _ADS_MODULE_NAMES:
                 continue
+            
+            friendly_name = str(getattr(inst, 'friendly_name', '')).strip().lower()
             if friendly_name == 'ads':
                 continue
             if not hasattr(inst, 'instance_name'):
@@ -413,6 +684,19 @@ async def fetch_valid_instances() -> list:
         return []
 
 
+@functools.lru_cache(maxsize=64)
+def _state_label(state: Any) -> str:
+    """Turn an AMP state value (e.g. State.Ready) into a display label."""
+    state_str = str(state)
+    if '.' in state_str:
+        state_val = state_str.split('.')[-1].replace('_', ' ').capitalize()
+    else:
+        state_val = state_str.replace('_', ' ').capitalize()
+    
+    # Treat 'Ready' as 'Running' for user clarity
+    return 'Running' if state_val.lower() == 'ready' else state_val
+
+
 def get_instance_state(status) -> str:
     """
     Extract human-readable state from AMP instance status.
@@ -425,14 +709,7 @@ def get_instance_state(status) -> str:
     """
     try:
         if hasattr(status, 'state') and status.state:
-            state_str = str(status.state)
-            if '.' in state_str:
-                state_val = state_str.split('.')[-1].replace('_', ' ').capitalize()
-            else:
-                state_val = state_str.replace('_', ' ').capitalize()
-            
-            # Treat 'Ready' as 'Running' for user clarity
-            return 'Running' if state_val.lower() == 'ready' else state_val
+            return _state_label(status.state)
             
         elif hasattr(status, 'running'):
             return 'Running' if status.running else 'Stopped'
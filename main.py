@@ -7,13 +7,14 @@ Main entry point with improved config loading, logging, and error handling.
 import os
 import sys
 import asyncio
+import importlib
 import logging
 from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-from cogs.utils import setup_logging, get_logger
+from cogs.utils import setup_logging, get_logger, flush_pending_saves, invalidate_category_index
 
 # =============================================================================
 # CONFIGURATION
@@ -21,6 +22,12 @@ from cogs.utils import setup_logging, get_logger
 
 log = get_logger("main")
 
+# Maximum cogs loaded at once during startup
+COG_LOAD_CONCURRENCY = 4
+
+# Maximum guilds synced at once; discord.py still applies rate limits
+COMMAND_SYNC_CONCURRENCY = 4
+
 
 class Config:
     """Bot configuration with validation."""
@@ -52,14 +59,12 @@ class Config:
             sys.exit(1)
         
         try:
-            # Import config module
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("config", config_path)
-            if spec is None or spec.loader is None:
-                raise ImportError("Failed to load config.py spec")
-            
-            config_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(config_module)
+            # Import config through the normal importer so its .pyc is reused
+            # and cogs doing `import config` share the same module object
+            config_dir = str(config_path.resolve().parent)
+            if config_dir not in sys.path:
+                sys.path.insert(0, config_dir)
+            config_module = importlib.import_module("config")
             
             # Required settings
             config.bot_token = getattr(config_module, 'BOT_TOKEN', '')
@@ -140,20 +145,29 @@ class CalmBot(commands.Bot):
         loaded = []
         failed = []
         
-        for filename in sorted(os.listdir(cogs_dir)):
-            if not filename.endswith(".py"):
-                continue
-            if filename == "utils.py":  # Skip utility module
-                continue
-            
-            cog_name = f"cogs.{filename[:-3]}"
-            
-            try:
+        with os.scandir(cogs_dir) as entries:
+            filenames = sorted(
+                entry.name for entry in entries
+                # Skip the utility module and anything that isn't a .py file
+                if entry.name.endswith(".py") and entry.name != "utils.py" and entry.is_file()
+            )
+        
+        cog_names = [f"cogs.{filename[:-3]}" for filename in filenames]
+        
+        # Load concurrently so slow cog_load hooks (file reads, API calls) overlap
+        semaphore = asyncio.Semaphore(COG_LOAD_CONCURRENCY)
+        
+        async def load(cog_name: str):
+            async with semaphore:
                 await self.load_extension(cog_name)
+        
+        results = await asyncio.gather(*(load(name) for name in cog_names), return_exceptions=True)
+        for cog_name, result in zip(cog_names, results):
+            if isinstance(result, BaseException):
+                failed.append((cog_name, str(result)))
+                log.error(f"Failed to load {cog_name}: {result}")
+            else:
                 loaded.append(cog_name)
-            except Exception as e:
-                failed.append((cog_name, str(e)))
-                log.error(f"Failed to load {cog_name}: {e}")
         
         # Summary
         if loaded:
@@ -172,21 +186,20 @@ class CalmBot(commands.Bot):
             log.warning("No guild IDs configured - skipping command sync")
             return
         
-        synced_count = 0
-        
-        for guild_id in self.config.guild_ids:
-            try:
-                guild = discord.Object(id=guild_id)
-                self.tree.copy_global_to(guild=guild)
-                synced = await self.tree.sync(guild=guild)
-                synced_count += len(synced)
-                log.debug(f"Synced {len(synced)} command(s) to guild {guild_id}")
-            except discord.HTTPException as e:
-                log.error(f"Failed to sync commands to guild {guild_id}: {e}")
+        semaphore = asyncio.Semaphore(COMMAND_SYNC_CONCURRENCY)
+        counts = await asyncio.gather(
+            *(self._sync_guild(guild_id, semaphore) for guild_id in self.config.guild_ids)
+        )
+        synced_count = sum(counts)
         
         if synced_count:
             log.info(f"Synced commands to {len(self.config.guild_ids)} guild(s)")
     
+    async def close(self):
+        """Write any queued data saves before shutting down."""
+        await flush_pending_saves()
+        await super().close()
+    
     async def on_ready(self):
         """Called when the bot is fully ready."""
         log.info("=" * 50)
@@ -197,6 +210,34 @@ class CalmBot(commands.Bot):
         log.info("=" * 50)
         log.info("Bot is ready!")
     
+    async def _sync_guild(self, guild_id: int, semaphore: asyncio.Semaphore) -> int:
+        """Sync slash commands to one guild, returning how many were synced."""
+        async with semaphore:
+            try:
+                guild = discord.Object(id=guild_id)
+                self.tree.copy_global_to(guild=guild)
+                synced = await self.tree.sync(guild=guild)
+                log.debug(f"Synced {len(synced)} command(s) to guild {guild_id}")
+                return len(synced)
+            except discord.HTTPException as e:
+                log.error(f"Failed to sync commands to guild {guild_id}: {e}")
+                return 0
+    
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        """Keep the category lookup index in sync with new categories."""
+        if isinstance(channel, discord.CategoryChannel):
+            invalidate_category_index(channel.guild.id)
+    
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Keep the category lookup index in sync with deleted categories."""
+        if isinstance(channel, discord.CategoryChannel):
+            invalidate_category_index(channel.guild.id)
+    
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        """Keep the category lookup index in sync with renamed categories."""
+        if isinstance(after, discord.CategoryChannel) and before.name != after.name:
+            invalidate_category_index(after.guild.id)
+    
     async def on_connect(self):
         """Called when connected to Discord."""
         log.debug("Connected to Discord gateway")